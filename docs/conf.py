@@ -25,14 +25,15 @@ release = '0.0.1'
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
-extensions = ['sphinx.ext.autodoc', 'sphinxcontrib.plantuml', 'sphinx.ext.todo']
+extensions = ['autoapi.extension', 'sphinxcontrib.plantuml', 'sphinx.ext.todo']
 
 # output TODOs into the docs
 todo_include_todos = True
 
 # Plantuml configuration
-cwd = os.getcwd()
-plantuml = 'java -jar {}'.format(os.path.join(cwd, 'utils/plantuml.jar'))
+# resolve the jar relative to this file, so the build does not depend on the working directory
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+plantuml = 'java -jar {}'.format(os.path.join(DOCS_DIR, 'utils', 'plantuml.jar'))
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
@@ -42,31 +43,22 @@ templates_path = ['_templates']
 # exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
 
-def remove_module_docstring(app, what, name, obj, options, lines):
-    """
-    Remove certain unwanted module docstrings for Sphinx output.
-
-    Invoked by Sphinx event autodoc-process-docstring.
-    Original idea from https://stackoverflow.com/a/18031024.
-    """
-    # delete unused parameters to denote that explicitly
-    del app
-    del obj
-    del options
-    if what == 'module' and name == 'libpdf':
-        del lines[:]
-
-
 def setup(app):
     """Add custom parts to the Sphinx app."""
-    # Option to remove certain unwanted module docstrings for autodoc automodule directive
-    app.connect('autodoc-process-docstring', remove_module_docstring)
-
     # Add a custom CSS class that expands the theme CSS rules
     app.add_css_file('mystyle.css')
 
 
-# -- Options for autodoc -------------------------------------------------
+# -- Options for autoapi -------------------------------------------------
+# sphinx-autoapi parses the sources statically, so libpdf and its dependencies
+# pdfplumber/pdfminer do not need to be importable to build the docs;
+# the API page is written by hand using the autoapi* directives
+autoapi_dirs = ['../libpdf']
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+autoapi_member_order = 'bysource'
+autoapi_options = ['members', 'undoc-members', 'show-inheritance']
+# the autoapi* directives are based on autodoc and take their options from here
 autodoc_typehints = 'description'
 autodoc_default_options = {
     'member-order': 'bysource',
@@ -75,6 +67,8 @@ autodoc_default_options = {
     'undoc-members': True,
     'show-inheritance': True,
 }
+# imports of optional dependencies like tqdm cannot be resolved statically
+suppress_warnings = ['autoapi.python_import_resolution']
 
 # -- Options for HTML output -------------------------------------------------
 
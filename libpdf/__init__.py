@@ -10,23 +10,48 @@ through an API and also as a command line interface.
 :license: MIT, see LICENSE for more details
 """  # noqa: D205, D400, D415 # needed for autodoc
 
-import importlib.metadata as importlib_metadata
+import importlib
+from typing import TYPE_CHECKING
 
-__version__: str = importlib_metadata.version("libpdf")
-__summary__: str = importlib_metadata.metadata("libpdf")["Summary"]
+from libpdf._import_forks import ensure_forks_on_path
+from libpdf._version import __summary__, __version__
 
-# below imports from libpdf.core cannot be at the top avoid circular import errors in
-# core.py when importing __version__ and __summary__
-import libpdf._import_forks  # noqa: F401
-from libpdf.core import main_api as load
-from libpdf.core import main_cli
+# the forked pdfminer/pdfplumber must be importable before any libpdf module that uses them is loaded
+ensure_forks_on_path()
+
+if TYPE_CHECKING:
+    from libpdf.core import main_api as load
+    from libpdf.core import main_cli
+
+# objects that are imported on first access, so 'import libpdf' does not load libpdf.core
+# and with it pdfplumber, pdfminer and the model tree;
+# a value of None for the attribute name means the module itself is exposed
+_LAZY_IMPORTS = {
+    "load": ("libpdf.core", "main_api"),
+    "main_cli": ("libpdf.core", "main_cli"),
+    "core": ("libpdf.core", None),
+}
 
 # define importable objects
 __all__ = ["__summary__", "__version__", "load"]
 
+
+def __getattr__(name: str):
+    """Import the objects listed in _LAZY_IMPORTS on first access (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = _LAZY_IMPORTS[name]
+    value = importlib.import_module(module_name)
+    if attr_name is not None:
+        value = getattr(value, attr_name)
+    # cache in module globals so __getattr__ is not invoked again
+    globals()[name] = value
+    return value
+
+
 # Enable running
 #   python -m libpdf.__init__
 #   python libpdf/__init__.py
 # before installing the package itself
 if __name__ == "__main__":
-    main_cli()
+    __getattr__("main_cli")()
@@ -10,27 +10,35 @@ This should be resolved in future by
 These 2 methods take time, so below solution is a short-term workaround.
 """
 
+import importlib.util
 import os
 import sys
 
 DEPS_DIR = os.path.join(os.path.dirname(__file__), "..", "deps")
 
-# first try to import the dependencies so active venvs with direct Git dependencies are not overriden
-try:
-    import pdfminer
-except ModuleNotFoundError:
-    # make dependency available as wheel to sys.path as first entry
-    sys.path.insert(
-        0, os.path.join(DEPS_DIR, "pdfminer.six-20200517.dev1-py3-none-any.whl")
-    )
-else:
-    del pdfminer
-
-try:
-    import pdfplumber
-except ModuleNotFoundError:
-    sys.path.insert(
-        0, os.path.join(DEPS_DIR, "pdfplumber-0.5.21.dev1-py3-none-any.whl")
-    )
-else:
-    del pdfplumber
+_DONE = False
+
+
+def ensure_forks_on_path():
+    """
+    Make the forked dependencies available on sys.path if they are not installed.
+
+    The check runs only once per interpreter session, further calls return immediately.
+    """
+    global _DONE  # noqa: PLW0603 # pylint: disable=global-statement  # run-once flag
+    if _DONE:
+        return
+    _DONE = True
+
+    # first check whether the dependencies are installed so active venvs with direct Git dependencies
+    # are not overriden; find_spec does not execute the packages
+    if importlib.util.find_spec("pdfminer") is None:
+        # make dependency available as wheel to sys.path as first entry
+        sys.path.insert(
+            0, os.path.join(DEPS_DIR, "pdfminer.six-20200517.dev1-py3-none-any.whl")
+        )
+
+    if importlib.util.find_spec("pdfplumber") is None:
+        sys.path.insert(
+            0, os.path.join(DEPS_DIR, "pdfplumber-0.5.21.dev1-py3-none-any.whl")
+        )
@@ -0,0 +1,9 @@
+"""
+Package version and summary.
+
+The values are kept as literals so ``import libpdf`` does not need to read the installed
+package metadata. Keep them in sync with ``version`` and ``description`` in pyproject.toml.
+"""
+
+__version__: str = "0.1.0"
+__summary__: str = "Extract structured data from PDFs."
@@ -30,6 +30,9 @@ class ApiObjects:  # pylint: disable = too-few-public-methods
     :vartype pdfminer: PDFDocument
     """
 
+    # fixed attribute set, no per-instance __dict__ needed
+    __slots__ = ("flattened", "pdfminer", "pdfplumber", "root")
+
     def __init__(  # pylint: disable=too-many-arguments  # the parameters are needed to describe in Sphinx autodoc
         self,
         root: Root,
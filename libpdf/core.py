@@ -1,5 +1,6 @@
 """Application entry point."""
 
+import inspect
 import logging
 import re
 import sys
@@ -7,18 +8,21 @@ from typing import List, Optional, Tuple
 
 import click
 
-# not importing load(), so no circular import when importing from root __init__.py
-from libpdf import __summary__, __version__, parameters  # pylint: disable=cyclic-import
+from libpdf import parameters
+from libpdf._version import __summary__, __version__
 from libpdf.apiobjects import ApiObjects
 from libpdf.extract import LibpdfError, extract
 from libpdf.log import config_logger, get_level_name, set_log_level
-from libpdf.parameters import RENDER_ELEMENTS
+from libpdf.parameters import RENDER_ELEMENTS, RENDER_ELEMENTS_SET
 from libpdf.process import output_dump
 from libpdf.progress import COLORAMA_AVAILABLE, TQDM_AVAILABLE, bar_format_lvl1, tqdm
 from libpdf.utils import visual_debug_libpdf
 
 LOG = logging.getLogger(__name__)
 
+# syntax of the CLI parameter page-range, comma separated pages or page ranges, e.g. 2-3,6,8-12
+PAGE_RANGE_PATTERN = re.compile(r"\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*")
+
 
 def main(  # pylint: disable=too-many-arguments,too-many-locals  # no reasonable workaround available for API/CLI entry
     pdf: str,
@@ -92,7 +96,7 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals  # no reasonable
     ) as overall_pbar:
         pages = None
         if page_range:
-            pages = sorted(calculate_pages(page_range))
+            pages = calculate_pages(page_range)
 
         if not TQDM_AVAILABLE:
             LOG.warning("Install optional dependency 'tqdm' for progress bars")
@@ -102,27 +106,29 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals  # no reasonable
                 "Install optional dependency 'colorama' for colored progress bars"
             )
 
-        LOG.info("Verbosity level: %s", get_level_name(verbose))
-        LOG.info("Input file: %s", pdf)
-        LOG.info("Output format: %s", output_format)
-        if output_path:
-            LOG.info("Output path: %s", output_path)
-        else:
-            LOG.info("Writing extracted data to stdout")
-        LOG.info(
-            "Page range: [%s]", "all" if not pages else ",".join(str(x) for x in pages)
-        )
-        LOG.info(
-            "Page crop: %s",
-            "not cropped" if not page_crop else " ".join(str(x) for x in page_crop),
-        )
-        LOG.info("Smart page crop: %s", "on" if smart_page_crop else "off")
-        LOG.info("Extract annotations: %s", "no" if no_annotations else "yes")
-        LOG.info("Extract chapters: %s", "no" if no_chapters else "yes")
-        LOG.info("Extract paragraphs: %s", "no" if no_paragraphs else "yes")
-        LOG.info("Extract tables: %s", "no" if no_tables else "yes")
-        LOG.info("Extract figures: %s", "no" if no_figures else "yes")
-        LOG.info("Extract rects: %s", "no" if no_rects else "yes")
+        # the run configuration is only logged on INFO level, skip building the messages otherwise
+        if LOG.isEnabledFor(logging.INFO):
+            LOG.info("Verbosity level: %s", get_level_name(verbose))
+            LOG.info("Input file: %s", pdf)
+            LOG.info("Output format: %s", output_format)
+            if output_path:
+                LOG.info("Output path: %s", output_path)
+            else:
+                LOG.info("Writing extracted data to stdout")
+            LOG.info(
+                "Page range: [%s]", "all" if not pages else ",".join(map(str, pages))
+            )
+            LOG.info(
+                "Page crop: %s",
+                "not cropped" if not page_crop else " ".join(str(x) for x in page_crop),
+            )
+            LOG.info("Smart page crop: %s", "on" if smart_page_crop else "off")
+            LOG.info("Extract annotations: %s", "no" if no_annotations else "yes")
+            LOG.info("Extract chapters: %s", "no" if no_chapters else "yes")
+            LOG.info("Extract paragraphs: %s", "no" if no_paragraphs else "yes")
+            LOG.info("Extract tables: %s", "no" if no_tables else "yes")
+            LOG.info("Extract figures: %s", "no" if no_figures else "yes")
+            LOG.info("Extract rects: %s", "no" if no_rects else "yes")
         overall_pbar.update(1)
         try:
             objects = extract(
@@ -168,6 +174,10 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals  # no reasonable
     return None
 
 
+# parameter names of main(), main_api() forwards its arguments of the same name
+MAIN_PARAMETERS = frozenset(inspect.signature(main).parameters)
+
+
 def main_api(  # pylint: disable=too-many-arguments, too-many-locals
     pdf: str,
     verbose: int = 1,  # log level WARNING for library usage is considered a good compromise as a default
@@ -218,47 +228,31 @@ def main_api(  # pylint: disable=too-many-arguments, too-many-locals
     :param visual_debug_exclude_elements: a list of elements that shall be excluded when visual debugging
     :return: instance of :class:`~libpdf.apiobjects.ApiObjects` class
     """
+    # all parameters shared with main() are forwarded as they are, taken before any other local is defined
+    main_kwargs = {
+        name: value for name, value in locals().items() if name in MAIN_PARAMETERS
+    }
     if init_logging:
         config_logger(cli=False)
         set_log_level(verbose)
     # check visual debug include/exclude elements
     if visual_debug:
         if visual_debug_include_elements:
-            for visual_incl_element in visual_debug_include_elements:
-                if visual_incl_element not in RENDER_ELEMENTS:
-                    raise ValueError(
-                        f"Given visual included elements {visual_incl_element} not in {RENDER_ELEMENTS}",
-                    )
+            unknown_elements = set(visual_debug_include_elements) - RENDER_ELEMENTS_SET
+            if unknown_elements:
+                raise ValueError(
+                    f"Given visual included elements {sorted(unknown_elements)} not in {RENDER_ELEMENTS}",
+                )
         if visual_debug_exclude_elements:
-            for visual_excl_element in visual_debug_exclude_elements:
-                if visual_excl_element not in RENDER_ELEMENTS:
-                    raise ValueError(
-                        f"Given visual excluded elements {visual_excl_element} not in {RENDER_ELEMENTS}",
-                    )
+            unknown_elements = set(visual_debug_exclude_elements) - RENDER_ELEMENTS_SET
+            if unknown_elements:
+                raise ValueError(
+                    f"Given visual excluded elements {sorted(unknown_elements)} not in {RENDER_ELEMENTS}",
+                )
         if visual_debug_include_elements and visual_debug_exclude_elements:
             raise ValueError("Can not visual include and exclude at the same time.")
 
-    objects = main(
-        pdf,
-        verbose=verbose,
-        page_range=page_range,
-        page_crop=page_crop,
-        smart_page_crop=smart_page_crop,
-        save_figures=save_figures,
-        figure_dir=figure_dir,
-        no_annotations=no_annotations,
-        no_chapters=no_chapters,
-        no_paragraphs=no_paragraphs,
-        no_tables=no_tables,
-        no_figures=no_figures,
-        no_rects=no_rects,
-        cli_usage=False,
-        visual_debug=visual_debug,
-        visual_debug_output_dir=visual_debug_output_dir,
-        visual_split_elements=visual_split_elements,
-        visual_debug_include_elements=visual_debug_include_elements,
-        visual_debug_exclude_elements=visual_debug_exclude_elements,
-    )
+    objects = main(**main_kwargs, cli_usage=False)
     return objects
 
 
@@ -287,11 +281,11 @@ def validate_range(ctx, param, value):
     if value is None:
         # this can only happen when the range is not given
         return value
-    match = re.match(r"^(\d+-\d+|\d+)(,(\d+-\d+|\d+))*$", value)
+    match = PAGE_RANGE_PATTERN.fullmatch(value)
     if match is None:
         raise click.BadParameter("must follow the example pattern 2-3,6,8-12")
-    numbers = value.replace("-", ",").split(",")
-    if not all(int(x) < int(y) for x, y in zip(numbers, numbers[1:])):
+    numbers = [int(x) for x in value.replace("-", ",").split(",")]
+    if not all(x < y for x, y in zip(numbers, numbers[1:])):
         raise click.BadParameter("values must increase monotonic")
     return value
 
@@ -314,13 +308,14 @@ def validate_visual_elements(ctx, param, value):
         value = value[0]
 
     elements = value.split(",")
-    if len(elements) != len(set(elements)):
+    unique_elements = set(elements)
+    if len(elements) != len(unique_elements):
         raise click.BadParameter(f"Option {param.name} contains duplicate entries.")
-    for element in elements:
-        if element not in RENDER_ELEMENTS:
-            raise click.BadParameter(
-                f"Option {param.name} contains an unknown entry '{element}'."
-            )
+    unknown_elements = unique_elements - RENDER_ELEMENTS_SET
+    if unknown_elements:
+        raise click.BadParameter(
+            f"Option {param.name} contains unknown entries '{','.join(sorted(unknown_elements))}'."
+        )
     if param.name == "visual_debug_exclude_elements":
         if len(elements) == len(RENDER_ELEMENTS):
             # TODO Why is this not supported? It will just save the pages as images which might also be useful.
@@ -345,28 +340,33 @@ class DependentOption(click.Option):
         """Initialize class."""
         self.depends_on = set(kwargs.pop("depends_on", []))
         self.mutually_exclusive = set(kwargs.pop("mutually_exclusive", []))
+        # joined once for both the help text and the usage errors
+        self._depends_on_str = ", ".join(self.depends_on)
+        self._mutually_exclusive_str = ", ".join(self.mutually_exclusive)
 
         help_msgs = []
         if self.depends_on:
-            help_msgs.append(f"this option depends on [{', '.join(self.depends_on)}]")
+            help_msgs.append(f"this option depends on [{self._depends_on_str}]")
         if self.mutually_exclusive:
             help_msgs.append(
-                f"this option is mutually exclusive with [{', '.join(self.mutually_exclusive)}]"
+                f"this option is mutually exclusive with [{self._mutually_exclusive_str}]"
             )
         kwargs["help"] = kwargs.get("help", "") + (f' NOTE: {"; ".join(help_msgs)}')
         super().__init__(*args, **kwargs)
 
     def handle_parse_result(self, ctx, opts, args):
         """Handle parse result."""
-        if (not self.depends_on.intersection(opts)) and self.name in opts:
-            raise click.UsageError(
-                f"Illegal usage: '{self.name}' depends on '{', '.join(self.depends_on)}' which is not given.",
-            )
-        if self.mutually_exclusive.intersection(opts) and self.name in opts:
-            raise click.UsageError(
-                f"Illegal usage: '{self.name}' is mutually exclusive with '{', '.join(self.mutually_exclusive)}' "
-                "which is also given.",
-            )
+        # dependencies only matter if the option itself is given
+        if self.name in opts:
+            if not self.depends_on.intersection(opts):
+                raise click.UsageError(
+                    f"Illegal usage: '{self.name}' depends on '{self._depends_on_str}' which is not given.",
+                )
+            if self.mutually_exclusive.intersection(opts):
+                raise click.UsageError(
+                    f"Illegal usage: '{self.name}' is mutually exclusive with '{self._mutually_exclusive_str}' "
+                    "which is also given.",
+                )
 
         return super().handle_parse_result(ctx, opts, args)
 
@@ -538,16 +538,12 @@ def calculate_pages(page_range_string) -> List[int]:
     Calculate a list of pages from the ranges given as CLI parameter page-range.
 
     :param page_range_string: CLI parameter page-range
-    :return: list of pages in given range
+    :return: sorted list of unique pages in given range
     """
-    page_ranges = page_range_string.split(",")
-    pages = []
-    for page_range in page_ranges:
-        if "-" in page_range:
-            start_page = int(page_range.split("-")[0])
-            end_page = int(page_range.split("-")[1])
-        else:
-            start_page = int(page_range)
-            end_page = int(page_range)
-        pages.extend(list(range(start_page, end_page + 1)))
-    return pages
+    pages = set()
+    for page_range in page_range_string.split(","):
+        start_page, _, end_page = page_range.partition("-")
+        start_page = int(start_page)
+        end_page = int(end_page) if end_page else start_page
+        pages.update(range(start_page, end_page + 1))
+    return sorted(pages)
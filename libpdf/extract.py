@@ -2,13 +2,15 @@
 
 import itertools
 import logging
+import math
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 import pdfplumber
-import yaml
 from pdfminer.layout import LTText
 
 from libpdf import parameters
@@ -16,7 +18,7 @@ from libpdf import process as pro
 from libpdf.apiobjects import ApiObjects
 from libpdf.catalog import catalog, extract_catalog
 from libpdf.exceptions import LibpdfError
-from libpdf.log import logging_needed
+from libpdf.log import make_logging_needed
 from libpdf.models.figure import Figure
 from libpdf.models.file import File
 from libpdf.models.file_meta import FileMeta
@@ -36,7 +38,8 @@ from libpdf.progress import bar_format_lvl2, tqdm
 from libpdf.tables import extract_pdf_table
 from libpdf.textbox import extract_linked_chars, extract_paragraphs_chapters
 from libpdf.utils import (
-    lt_page_crop,
+    index_lt_objs_by_x0,
+    lt_page_crop_indexed,
     lt_textbox_crop,
     lt_to_libpdf_hbox_converter,
     to_pdfplumber_bbox,
@@ -44,17 +47,26 @@ from libpdf.utils import (
 
 LOG = logging.getLogger(__name__)
 
+# removes the apostrophes of the PDF date timezone and converts the zulu timezone Z to +
+DATE_TRANSLATION_TABLE = str.maketrans({"'": None, "Z": "+"})
 
-class FoldedStr(str):
-    """Pass the folded string for scalar node."""
+# texts of the strange anno objects created by the layout analysis, see delete_page_ann()
+STRANGE_ANNO_TEXTS = frozenset((" ", "\n"))
 
-
-def folded_str_representer(dumper, text):
-    """Warp function of the representer."""
-    return dumper.represent_scalar("tag", text, style=">")
-
-
-yaml.add_representer(FoldedStr, folded_str_representer)
+# PDF metadata keys and the FileMeta parameters they are stored in
+METADATA_PARAMETERS = {
+    "Author": "author",
+    "Title": "title",
+    "Subject": "subject",
+    "Creator": "creator",
+    "Producer": "producer",
+    "Keywords": "keywords",
+    "Trapped": "trapped",
+}
+METADATA_DATE_PARAMETERS = {
+    "CreationDate": "creation_date",
+    "ModDate": "modified_date",
+}
 
 
 def extract(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
@@ -108,11 +120,12 @@ def extract(  # pylint: disable=too-many-locals, too-many-branches, too-many-sta
                     ",".join([str(x) for x in includelist_non_existent]),
                 )
 
-            # delete pages from pdfplumber that are not in the extracted_pages list
-            includelist_existent = list(set(pages) - set(includelist_non_existent))
-            for page in pdf.pages.copy():
-                if page.page_number not in includelist_existent:
-                    pdf.pages.remove(page)
+            # delete pages from pdfplumber that are not in the extracted_pages list,
+            # pdf.pages is the page list cached by pdfplumber so it is updated in place
+            includelist_existent = set(pages).difference(includelist_non_existent)
+            pdf.pages[:] = [
+                page for page in pdf.pages if page.page_number in includelist_existent
+            ]
 
             if len(pdf.pages) == 0:
                 message = "Page range selection: no pages left in the PDF to analyze."
@@ -137,7 +150,7 @@ def extract(  # pylint: disable=too-many-locals, too-many-branches, too-many-sta
         overall_pbar.update(1)
 
         # extract annotations, name destinations and outline
-        extract_catalog(pdf, no_annotations)
+        extract_catalog(pdf, no_annotations, no_chapters)
         overall_pbar.update(10)
 
         # In figure_dict, figures are sorted by pages and y coordinates.
@@ -250,43 +263,21 @@ def smart_page_crop_header_footer(  # pylint: disable=too-many-branches, too-man
 
     # smart algorithm to determine which elements shall be removed
     page_height = float(pdf.pages[0].mediabox[3])
+    min_page_cnt = parameters.HEADER_FOOTER_OCCURRENCE_PERCENTAGE * len(pdf.pages)
+    y_index = _index_elements_by_y(elements_list)
 
-    header_elements_list = []
     default_header_bottom = (
         1 - parameters.SMART_PAGE_CROP_REL_MARGINS["top"]
     ) * page_height
-
-    for pot_header_elements in elements_page_dict.values():  # pylint: disable=too-many-nested-blocks
-        # potential header element
-        for pot_header_element in pot_header_elements:
-            page_cnt = 0
-            # consider element partially inside potential header bbox
-            if pot_header_element.position.y0 >= default_header_bottom:
-                for header_elements in elements_page_dict.values():
-                    element_cnt = 0
-                    for header_element in header_elements:
-                        if (
-                            abs(
-                                pot_header_element.position.y0
-                                - header_element.position.y0
-                            )
-                            < 1
-                            and abs(
-                                pot_header_element.position.y1
-                                - header_element.position.y1
-                            )
-                            < 1
-                        ):
-                            element_cnt += 1
-                    # on one page several header elements may have same y coordination but count only once
-                    element_cnt = min(element_cnt, 1)
-                    page_cnt = page_cnt + element_cnt
-            # occur on more than HEADER_FOOTER_OCCURRENCE_PERCENTAGE pages, considered as header element
-            # and remove from list
-            if page_cnt >= parameters.HEADER_FOOTER_OCCURRENCE_PERCENTAGE * len(
-                pdf.pages
-            ):
-                header_elements_list.append(pot_header_element)
+    # consider element partially inside potential header bbox
+    # occur on more than HEADER_FOOTER_OCCURRENCE_PERCENTAGE pages, considered as header element
+    header_elements_list = [
+        pot_header_element
+        for pot_header_elements in elements_page_dict.values()
+        for pot_header_element in pot_header_elements
+        if pot_header_element.position.y0 >= default_header_bottom
+        and _count_pages_at_same_y(pot_header_element, y_index) >= min_page_cnt
+    ]
 
     # remove false header elements from potential header elements list
     if header_elements_list:
@@ -296,44 +287,24 @@ def smart_page_crop_header_footer(  # pylint: disable=too-many-branches, too-man
     else:
         real_header_elements_list = header_elements_list
 
-    # remove header elements
+    # remove header elements, the models have no __eq__ so comparing ids is equivalent to list membership
+    real_header_element_ids = {id(element) for element in real_header_elements_list}
     elements_list = [
-        element for element in elements_list if element not in real_header_elements_list
+        element
+        for element in elements_list
+        if id(element) not in real_header_element_ids
     ]
 
-    footer_elements_list = []
     default_footer_top = parameters.SMART_PAGE_CROP_REL_MARGINS["bottom"] * page_height
-    for pot_footer_elements in elements_page_dict.values():  # pylint: disable=too-many-nested-blocks
-        # potential footer element
-        for pot_footer_element in pot_footer_elements:
-            page_cnt = 0
-            # consider element partially insider potential footer bbox
-            if pot_footer_element.position.y1 <= default_footer_top:
-                for footer_elements in elements_page_dict.values():
-                    element_cnt = 0
-                    for footer_element in footer_elements:
-                        if (
-                            abs(
-                                pot_footer_element.position.y0
-                                - footer_element.position.y0
-                            )
-                            < 1
-                            and abs(
-                                pot_footer_element.position.y1
-                                - footer_element.position.y1
-                            )
-                            < 1
-                        ):
-                            element_cnt += 1
-                    # on one page several footer elements may have same y coordination but count only once
-                    element_cnt = min(element_cnt, 1)
-                    page_cnt = page_cnt + element_cnt
-            # occur on more than HEADER_FOOTER_OCCURRENCE_PERCENTAGE pages, considered as footer element
-            # and remove from list
-            if page_cnt >= parameters.HEADER_FOOTER_OCCURRENCE_PERCENTAGE * len(
-                pdf.pages
-            ):
-                footer_elements_list.append(pot_footer_element)
+    # consider element partially inside potential footer bbox
+    # occur on more than HEADER_FOOTER_OCCURRENCE_PERCENTAGE pages, considered as footer element
+    footer_elements_list = [
+        pot_footer_element
+        for pot_footer_elements in elements_page_dict.values()
+        for pot_footer_element in pot_footer_elements
+        if pot_footer_element.position.y1 <= default_footer_top
+        and _count_pages_at_same_y(pot_footer_element, y_index) >= min_page_cnt
+    ]
 
     # filter out false footer elements
     if footer_elements_list:
@@ -343,14 +314,61 @@ def smart_page_crop_header_footer(  # pylint: disable=too-many-branches, too-man
     else:
         real_footer_elements_list = footer_elements_list
 
-    # remove footer elements
+    # remove footer elements, the models have no __eq__ so comparing ids is equivalent to list membership
+    real_footer_element_ids = {id(element) for element in real_footer_elements_list}
     elements_list = [
-        element for element in elements_list if element not in real_footer_elements_list
+        element
+        for element in elements_list
+        if id(element) not in real_footer_element_ids
     ]
 
     return elements_list
 
 
+def _index_elements_by_y(elements_list):
+    """
+    Bucket elements by their floored y0 and y1 coordinates.
+
+    Two elements whose y0 and y1 differ by less than 1 are at most one bucket apart in each direction, so
+    _count_pages_at_same_y() only needs to probe the neighbouring buckets instead of all elements.
+
+    :param elements_list: elements to index
+    :return: dictionary mapping (floor(y0), floor(y1)) to a list of (y0, y1, page number) tuples
+    """
+    y_index = {}
+    for element in elements_list:
+        position = element.position
+        y_index.setdefault(
+            (math.floor(position.y0), math.floor(position.y1)), []
+        ).append((position.y0, position.y1, position.page.number))
+    return y_index
+
+
+def _count_pages_at_same_y(element, y_index):
+    """
+    Count the pages containing an element with the same y0 and y1 as the given element within a tolerance of 1.
+
+    On one page several elements may have the same y coordinates but the page counts only once.
+
+    :param element: element to search for
+    :param y_index: elements bucketed by _index_elements_by_y()
+    :return: number of pages
+    """
+    y0 = element.position.y0
+    y1 = element.position.y1
+    bucket_y0 = math.floor(y0)
+    bucket_y1 = math.floor(y1)
+    pages = set()
+    for offset_y0 in (-1, 0, 1):
+        for offset_y1 in (-1, 0, 1):
+            for other_y0, other_y1, page_num in y_index.get(
+                (bucket_y0 + offset_y0, bucket_y1 + offset_y1), ()
+            ):
+                if abs(y0 - other_y0) < 1 and abs(y1 - other_y1) < 1:
+                    pages.add(page_num)
+    return len(pages)
+
+
 def check_false_positive_header_footer(pdf, elements_list):  # pylint: disable=too-many-branches
     """
     Filter out not real header/footer elements from given potential header/footer elements list.
@@ -370,77 +388,97 @@ def check_false_positive_header_footer(pdf, elements_list):  # pylint: disable=t
 
     Go though the potential header/footer elements list, find the lowest y0 element on each page in the given list,
     check the criterion page break and unique y0 for all the lowest y0 elements through all the pages, if not meet
-    the criterion, then remove it from the potential header/footer elements list, then recursively check again.
-    """
-    elements_page_dict = {}
-    for element in elements_list:
-        if element.position.page.number not in elements_page_dict:
-            elements_page_dict[element.position.page.number] = []
-            elements_page_dict[element.position.page.number].append(element)
-        else:
-            elements_page_dict[element.position.page.number].append(element)
+    the criterion, then remove it from the potential header/footer elements list and check again until the criterion
+    is met.
 
-    # search the lowest element height on each page
-    element_low_pos_dict = {}
-    for page_num, elements in elements_page_dict.items():
-        lowest_element_pos = float(
-            f"{elements[0].position.y0:.4f}"
-        )  # restrict to 4 digits precision
-        for element in elements:
-            lowest_element_pos = min(
-                lowest_element_pos, float(f"{element.position.y0:.4f}")
-            )
-        element_low_pos_dict[page_num] = lowest_element_pos
-
-    start_page_low_pos = list(element_low_pos_dict)[0]
-    end_page_low_pos = list(element_low_pos_dict)[-1]
-    page_breaks = end_page_low_pos - start_page_low_pos + 1 - len(element_low_pos_dict)
-    # find the lowest y0
-    header_low_pos = min(set(element_low_pos_dict.values()))
-    # check continuous of potential header/footer element from start page to end page
-    if (
-        page_breaks / (end_page_low_pos - start_page_low_pos + 1)
-        <= PAGES_MISSING_HEADER_OR_FOOTER_PERCENTAGE
-    ):
-        # check unique low_pos
-        if len(set(element_low_pos_dict.values())) != 1:
-            # a list of page numbers to check the element's continuous
-            continuous_page_list = []
-            for page, low_pos_element in element_low_pos_dict.items():
-                if low_pos_element == header_low_pos:
-                    continuous_page_list.append(page)
-            # check header/footer continuous
-            sorted_continuous_page_list = sorted(continuous_page_list)
-            continuous_list_length = (
-                sorted_continuous_page_list[-1] - sorted_continuous_page_list[0] + 1
-            )
+    The removed y0 coordinates are always the lowest remaining ones, so the check sweeps once over the distinct y0
+    coordinates in ascending order and tracks the lowest remaining y0 of each page instead of filtering the list
+    again after each removal.
+    """
+    # pair each element with its y0 coordinate, restricted to 4 digits precision, so it is rounded only once
+    element_y0_list = [
+        (round(element.position.y0, 4), element) for element in elements_list
+    ]
+    page_y0_dict = {}
+    y0_pages_dict = {}
+    for element_y0, element in element_y0_list:
+        page_y0_dict.setdefault(element.position.page.number, []).append(element_y0)
+        y0_pages_dict.setdefault(element_y0, set()).add(element.position.page.number)
+    y0_counter = Counter(element_y0 for element_y0, _ in element_y0_list)
+
+    # the lowest element height on each page is the y0 at the page's index in its sorted y0 list
+    page_low_pos_idx = {}
+    for page_num, y0_list in page_y0_dict.items():
+        y0_list.sort()
+        page_low_pos_idx[page_num] = 0
+    low_pos_counter = Counter(y0_list[0] for y0_list in page_y0_dict.values())
+
+    # pages in order of their first appearance, start and end are moved inwards when pages run out of elements
+    page_order = list(page_y0_dict)
+    start_idx = 0
+    end_idx = len(page_order) - 1
+    remaining_pages = len(page_order)
+    remaining_elements = len(element_y0_list)
+
+    header_boundary = None
+    for header_low_pos in sorted(y0_pages_dict):
+        start_page_low_pos = page_order[start_idx]
+        end_page_low_pos = page_order[end_idx]
+        page_breaks = end_page_low_pos - start_page_low_pos + 1 - remaining_pages
+        # check continuous of potential header/footer element from start page to end page
+        if (
+            page_breaks / (end_page_low_pos - start_page_low_pos + 1)
+            <= PAGES_MISSING_HEADER_OR_FOOTER_PERCENTAGE
+        ):
+            # check unique low_pos
+            if len(low_pos_counter) == 1:
+                if remaining_elements == 1:
+                    return []
+                break
+            # the pages containing the lowest y0 to check the element's continuous
+            continuous_pages = y0_pages_dict[header_low_pos]
+            continuous_list_length = max(continuous_pages) - min(continuous_pages) + 1
             # TODO: need to improve the parameter UNIQUE_HEADER_OR_FOOTER_ELEMENTS_PERCENTAGE to solve
             #  partially continuous header or footer elements
-            if len(
-                sorted_continuous_page_list,
-            ) < continuous_list_length * HEADER_OR_FOOTER_CONTINUOUS_PERCENTAGE and len(
-                set(element_low_pos_dict.values()),
-            ) > max(
-                1,
-                UNIQUE_HEADER_OR_FOOTER_ELEMENTS_PERCENTAGE * len(pdf.pages),
+            if not (
+                len(continuous_pages)
+                < continuous_list_length * HEADER_OR_FOOTER_CONTINUOUS_PERCENTAGE
+                and len(low_pos_counter)
+                > max(1, UNIQUE_HEADER_OR_FOOTER_ELEMENTS_PERCENTAGE * len(pdf.pages))
             ):
-                for idx, element in enumerate(elements_list):
-                    if float(f"{element.position.y0:.4f}") == header_low_pos:
-                        del elements_list[idx]
-                # recursively check again, to find the next min_low_pos, which will determine the header/footer boundary
-                if elements_list:
-                    return check_false_positive_header_footer(pdf, elements_list)
-        elif len(elements_list) == 1:
-            elements_list.pop()
-    else:
-        for idx, element in enumerate(elements_list):
-            if float(f"{element.position.y0:.4f}") == header_low_pos:
-                del elements_list[idx]
-        # recursively check again, to find the next min_low_pos, which will determine the header/footer boundary
-        if elements_list:
-            return check_false_positive_header_footer(pdf, elements_list)
-
-    return elements_list
+                break
+
+        # remove the lowest elements and check again, to find the next min_low_pos, which will determine the
+        # header/footer boundary
+        header_boundary = header_low_pos
+        remaining_elements -= y0_counter[header_low_pos]
+        del low_pos_counter[header_low_pos]
+        # only pages containing header_low_pos change their lowest position
+        for page_num in y0_pages_dict[header_low_pos]:
+            y0_list = page_y0_dict[page_num]
+            low_pos_idx = page_low_pos_idx[page_num]
+            while low_pos_idx < len(y0_list) and y0_list[low_pos_idx] == header_low_pos:
+                low_pos_idx += 1
+            if low_pos_idx < len(y0_list):
+                page_low_pos_idx[page_num] = low_pos_idx
+                low_pos_counter[y0_list[low_pos_idx]] += 1
+            else:
+                del page_y0_dict[page_num]
+                remaining_pages -= 1
+        if not remaining_pages:
+            return []
+        while page_order[start_idx] not in page_y0_dict:
+            start_idx += 1
+        while page_order[end_idx] not in page_y0_dict:
+            end_idx -= 1
+
+    if header_boundary is None:
+        return elements_list
+    return [
+        element
+        for element_y0, element in element_y0_list
+        if element_y0 > header_boundary
+    ]
 
 
 def delete_page_ann(pdf):
@@ -458,6 +496,7 @@ def delete_page_ann(pdf):
     :return:
     """
     LOG.info("Deleting strange anno objects created by layout analysis ...")
+    page_logging_needed = make_logging_needed(len(pdf.pages))
     for idx_page, page in enumerate(
         tqdm(
             pdf.pages,
@@ -466,22 +505,28 @@ def delete_page_ann(pdf):
             bar_format=bar_format_lvl2(),
         ),
     ):
-        if logging_needed(idx_page, len(pdf.pages)):
+        if page_logging_needed(idx_page):
             LOG.debug(
                 "Deleting strange anno objects created by layout analysis page %s of %s",
                 idx_page + 1,
                 len(pdf.pages),
             )
         # filter out the strange items
-        if "anno" in page.objects:
-            page.objects["anno"] = [
+        page_objects = page.objects
+        annos = page_objects.get("anno")
+        if annos is not None:
+            annos = [
                 item
-                for item in page.objects["anno"]
-                if not (item["object_type"] == "anno" and item["text"] in [" ", "\n"])
+                for item in annos
+                if not (
+                    item["object_type"] == "anno" and item["text"] in STRANGE_ANNO_TEXTS
+                )
             ]
-            if not page.objects["anno"]:
+            if annos:
+                page_objects["anno"] = annos
+            else:
                 #  remove the whole key if it's empty after above operation
-                del page.objects["anno"]
+                del page_objects["anno"]
 
     return pdf
 
@@ -503,7 +548,9 @@ def file_info_extraction(pdf, pdf_path):
     # date format string example D:20110120163651-05'00'
     # zulu timezone Z0000 will be converted to +0000
     def _time_preprocess(date_str):  # converts to 20110120163651-0500
-        return date_str.replace("D:", "").replace("'", "").replace("Z", "+")
+        if date_str.startswith("D:"):
+            date_str = date_str[2:]
+        return date_str.translate(DATE_TRANSLATION_TABLE)
 
     def _get_datetime_format(date: str):
         """
@@ -516,32 +563,16 @@ def file_info_extraction(pdf, pdf_path):
         return "%Y%m%d%H%M%S"  # without timezone
 
     file_meta_params = {}
-    if "Author" in pdf.metadata:
-        file_meta_params.update({"author": pdf.metadata["Author"]})
-    if "Title" in pdf.metadata:
-        file_meta_params.update({"title": pdf.metadata["Title"]})
-    if "Subject" in pdf.metadata:
-        file_meta_params.update({"subject": pdf.metadata["Subject"]})
-    if "Creator" in pdf.metadata:
-        file_meta_params.update({"creator": pdf.metadata["Creator"]})
-    if "Producer" in pdf.metadata:
-        file_meta_params.update({"producer": pdf.metadata["Producer"]})
-    if "Keywords" in pdf.metadata:
-        file_meta_params.update({"keywords": pdf.metadata["Keywords"]})
-    if "CreationDate" in pdf.metadata:
-        preprocessed_date = _time_preprocess(pdf.metadata["CreationDate"])
-        time_format = _get_datetime_format(preprocessed_date)
-        file_meta_params.update({
-            "creation_date": datetime.strptime(preprocessed_date, time_format)
-        })
-    if "ModDate" in pdf.metadata:
-        preprocessed_date = _time_preprocess(pdf.metadata["ModDate"])
-        time_format = _get_datetime_format(preprocessed_date)
-        file_meta_params.update({
-            "modified_date": datetime.strptime(preprocessed_date, time_format)
-        })
-    if "Trapped" in pdf.metadata:
-        file_meta_params.update({"trapped": pdf.metadata["Trapped"]})
+    for metadata_key, param_name in METADATA_PARAMETERS.items():
+        if metadata_key in pdf.metadata:
+            file_meta_params[param_name] = pdf.metadata[metadata_key]
+    for metadata_key, param_name in METADATA_DATE_PARAMETERS.items():
+        if metadata_key in pdf.metadata:
+            preprocessed_date = _time_preprocess(pdf.metadata[metadata_key])
+            time_format = _get_datetime_format(preprocessed_date)
+            file_meta_params[param_name] = datetime.strptime(
+                preprocessed_date, time_format
+            )
 
     file_meta_data = FileMeta(**file_meta_params)
 
@@ -574,6 +605,7 @@ def extract_page_metadata(pdf):
     LOG.info("Extracting page metadata ...")
     page_list = []
 
+    page_logging_needed = make_logging_needed(len(pdf.pages))
     for idx_page, page in enumerate(
         tqdm(
             pdf.pages,
@@ -582,7 +614,7 @@ def extract_page_metadata(pdf):
             bar_format=bar_format_lvl2(),
         ),
     ):
-        if logging_needed(idx_page, len(pdf.pages)):
+        if page_logging_needed(idx_page):
             LOG.debug("Extracting metadata page %s of %s", idx_page + 1, len(pdf.pages))
         page_obj = Page(page.page_number, float(page.width), float(page.height))
         page_list.append(page_obj)
@@ -598,7 +630,9 @@ def extract_figures(
     """Extract figures in PDF."""
     LOG.info("Extracting figures ...")
     figure_list = []
+    abs_figure_dir = os.path.abspath(figure_dir)
 
+    page_logging_needed = make_logging_needed(len(pdf.pages))
     for idx_page, page in enumerate(  # pylint: disable=too-many-nested-blocks
         tqdm(
             pdf.pages,
@@ -607,36 +641,38 @@ def extract_figures(
             bar_format=bar_format_lvl2(),
         ),
     ):
-        if logging_needed(idx_page, len(pdf.pages)):
+        if page_logging_needed(idx_page):
             LOG.debug("Extracting figures page %s of %s", idx_page + 1, len(pdf.pages))
         page_crop = pro.remove_page_header_footer(page)
-        lt_page = page._layout  # pylint: disable=protected-access  # easiest way to obtain LTPage
 
         # check and filter figures
         figures = check_and_filter_figures(page_crop.figures)
 
         if len(figures) != 0:
+            lt_page = page._layout  # pylint: disable=protected-access  # easiest way to obtain LTPage
+            # index the text objects once for all figures on the page
+            lt_texts_index = index_lt_objs_by_x0(
+                lt_page._objs,  # pylint: disable=protected-access # access needed
+                LTText,
+            )
+            page_obj = pages_list[idx_page]
+            has_annos = bool(catalog["annos"])
             for idx_figure, figure in enumerate(figures):
                 fig_pos = Position(
                     float(figure["x0"]),
                     float(figure["y0"]),
                     float(figure["x1"]),
                     float(figure["y1"]),
-                    pages_list[idx_page],
+                    page_obj,
                 )
                 bbox = (fig_pos.x0, fig_pos.y0, fig_pos.x1, fig_pos.y1)
 
-                lt_textboxes = lt_page_crop(
-                    bbox,
-                    lt_page._objs,  # pylint: disable=protected-access # access needed
-                    LTText,
-                    contain_completely=True,
-                )
+                lt_textboxes = lt_page_crop_indexed(bbox, lt_texts_index)
 
                 textboxes = []
                 links = []
                 for lt_textbox in lt_textboxes:
-                    if catalog["annos"]:
+                    if has_annos:
                         links.extend(extract_linked_chars(lt_textbox, lt_page.pageid))
                     bbox = (lt_textbox.x0, lt_textbox.y0, lt_textbox.x1, lt_textbox.y1)
 
@@ -645,17 +681,17 @@ def extract_figures(
                     textboxes.append(hbox)
 
                 image_name = f"page_{page.page_number}_figure.{idx_figure + 1}.png"
-
-                # create figures directory if not exist
-                Path(figure_dir).mkdir(parents=True, exist_ok=True)
-
-                image_path = os.path.abspath(os.path.join(figure_dir, image_name))
+                image_path = os.path.join(abs_figure_dir, image_name)
 
                 figure = Figure(
                     idx_figure + 1, image_path, fig_pos, links, textboxes, "None"
                 )
                 figure_list.append(figure)
 
+    # create figures directory if not exist
+    if figure_list:
+        Path(figure_dir).mkdir(parents=True, exist_ok=True)
+
     return figure_list
 
 
@@ -667,6 +703,7 @@ def extract_rects(
     LOG.info("Extracting rects ...")
     rect_list = []
 
+    page_logging_needed = make_logging_needed(len(pdf.pages))
     for idx_page, page in enumerate(  # pylint: disable=too-many-nested-blocks
         tqdm(
             pdf.pages,
@@ -675,10 +712,8 @@ def extract_rects(
             bar_format=bar_format_lvl2(),
         ),
     ):
-        if logging_needed(idx_page, len(pdf.pages)):
+        if page_logging_needed(idx_page):
             LOG.debug("Extracting rects page %s of %s", idx_page + 1, len(pdf.pages))
-        page_crop = pro.remove_page_header_footer(page)
-        lt_page = page._layout  # pylint: disable=protected-access  # easiest way to obtain LTPage
 
         # check and filter figures
         # figures = check_and_filter_figures(page_crop.objects['figure']) if 'figure' in page_crop.objects else []
@@ -686,6 +721,7 @@ def extract_rects(
         rects = page.objects["rect"] if "rect" in page.objects else []
 
         if len(rects) != 0:
+            lt_page = page._layout  # pylint: disable=protected-access  # easiest way to obtain LTPage
             for idx_rect, rect in enumerate(rects):
                 rect_pos = Position(
                     float(rect["x0"]),
@@ -722,7 +758,9 @@ def extract_rects(
                 rect = Rect(idx_rect + 1, rect_pos, hbox, non_stroking_color)
                 rect_list.append(rect)
 
-        else:
+        elif LOG.isEnabledFor(logging.INFO):
+            # the cropped page is only needed for the log message
+            page_crop = pro.remove_page_header_footer(page)
             LOG.info(
                 f"found no rects on page {idx_page + 1}: {page_crop.objects.keys()}"
             )
@@ -732,26 +770,44 @@ def extract_rects(
 
 
 def images_to_save(pdf, figure_list):
-    """Save images to given path."""
-    for fig in figure_list:
-        for pdf_page in pdf.pages:
-            if pdf_page.page_number == fig.position.page.number:
-                page = pdf_page
+    """
+    Save images to given path.
 
-        page_crop = pro.remove_page_header_footer(page)
+    The pages are rendered one after the other, the PNG encoding and writing of the figure images runs in a thread
+    pool as Pillow releases the GIL while compressing.
+    """
+    pages_by_number = {page.page_number: page for page in pdf.pages}
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        save_futures = []
+        # figures are extracted page by page, so each page is looked up, cropped and rendered only once
+        for page_number, page_figures in itertools.groupby(
+            figure_list, key=lambda fig: fig.position.page.number
+        ):
+            page = pages_by_number[page_number]
+            page_crop = pro.remove_page_header_footer(page)
+            # pdfplumber always rasterizes the whole page and crops the result to the bbox of the cropped page,
+            # so the full page image is rendered once and passed to the figures as their original
+            page_image = page.to_image(resolution=300).original
+
+            for fig in page_figures:
+                bbox = to_pdfplumber_bbox(
+                    fig.position.x0,
+                    fig.position.y0,
+                    fig.position.x1,
+                    fig.position.y1,
+                    page.height,
+                )
+                crop_page_figure = page_crop.within_bbox(bbox)
+                image_path = fig.rel_path
 
-        bbox = to_pdfplumber_bbox(
-            fig.position.x0,
-            fig.position.y0,
-            fig.position.x1,
-            fig.position.y1,
-            page.height,
-        )
-        crop_page_figure = page_crop.within_bbox(bbox)
-        image_path = fig.rel_path
+                image = crop_page_figure.to_image(resolution=300, original=page_image)
+                save_futures.append(
+                    executor.submit(image.save, image_path, format="png")
+                )
 
-        image = crop_page_figure.to_image(resolution=300)
-        image.save(image_path, format="png")
+        # re-raise errors of the workers
+        for save_future in save_futures:
+            save_future.result()
 
 
 def check_and_filter_figures(figures_list):  # pylint: disable=too-many-branches
@@ -801,27 +857,20 @@ def check_and_filter_figures(figures_list):  # pylint: disable=too-many-branches
 
     if len(filtered_figures) < len(figures_list):
         LOG.debug(
-            f"check_and_filter_figures removed {len(figures_list) - len(filtered_figures)} out of {len(figures_list)}  due to invalid height/width"
+            "check_and_filter_figures removed %s out of %s  due to invalid height/width",
+            len(figures_list) - len(filtered_figures),
+            len(figures_list),
         )
 
     for figure in filtered_figures:
         # if figure exceed the boundary of the page, then only keep the part of figure that inside this page
-        if not (
-            figure["x0"] >= 0
-            and figure["y0"] >= 0
-            and figure["x1"] >= 0
-            and figure["y1"] >= 0
-        ):
-            if figure["x0"] < 0:
-                figure["x0"] = 0
-            if figure["y0"] < 0:
-                figure["y0"] = 0
-            if figure["x1"] < 0:
-                figure["x1"] = 0
-            if figure["y1"] < 0:
-                figure["y1"] = 0
-
-    # check if figures completely inside another figures and remove small figures
+        for coordinate in ("x0", "y0", "x1", "y1"):
+            if figure[coordinate] < 0:
+                figure[coordinate] = 0
+
+    # check if figures completely inside another figures and remove small figures,
+    # removed figures are collected by id and filtered out once after comparing all pairs
+    removed_figure_ids = set()
     for fig0, fig1 in itertools.combinations(filtered_figures, 2):
         if (
             fig0["x0"] <= fig1["x0"]
@@ -829,9 +878,12 @@ def check_and_filter_figures(figures_list):  # pylint: disable=too-many-branches
             and fig0["x1"] >= fig1["x1"]
             and fig0["y1"] >= fig1["y1"]
         ):
-            if fig1 in filtered_figures:
+            if id(fig1) not in removed_figure_ids:
                 LOG.debug("remove filtered figure due to contained in other figure")
-                filtered_figures.remove(fig1)
+                removed_figure_ids.add(id(fig1))
+    filtered_figures = [
+        figure for figure in filtered_figures if id(figure) not in removed_figure_ids
+    ]
 
     # check if figures partially overlap
     for fig0, fig1 in itertools.combinations(filtered_figures, 2):
@@ -850,18 +902,23 @@ def check_and_filter_figures(figures_list):  # pylint: disable=too-many-branches
             ):
                 # compare the size of two figures, keep the bigger figure
                 if fig0["width"] * fig0["height"] <= fig1["width"] * fig1["height"]:
-                    if fig0 in filtered_figures:
+                    if id(fig0) not in removed_figure_ids:
                         LOG.debug(
                             "remove filtered figure fig0 due to partially overlap"
                         )
-                        filtered_figures.remove(fig0)
-                elif fig1 in filtered_figures:
+                        removed_figure_ids.add(id(fig0))
+                elif id(fig1) not in removed_figure_ids:
                     LOG.debug("remove filtered figure fig1 due to partially overlap")
-                    filtered_figures.remove(fig1)
+                    removed_figure_ids.add(id(fig1))
+    filtered_figures = [
+        figure for figure in filtered_figures if id(figure) not in removed_figure_ids
+    ]
 
     if len(filtered_figures) < len(figures_list):
         LOG.debug(
-            f"check_and_filter_figures removed {len(figures_list) - len(filtered_figures)} out of {len(figures_list)} figures"
+            "check_and_filter_figures removed %s out of %s figures",
+            len(figures_list) - len(filtered_figures),
+            len(figures_list),
         )
 
     return filtered_figures
@@ -6,21 +6,19 @@ https://www.geeksforgeeks.org/python-add-logging-to-python-libraries/
 """
 
 import logging
-import math
 
-from libpdf.progress import TQDM_AVAILABLE, tqdm
+# log levels for the CLI verbosity flag in words
+VERBOSITY_LEVEL_NAMES = {
+    0: "ERROR/FATAL/CRITICAL",
+    1: "WARNING",
+    2: "INFO",
+    3: "DEBUG",
+}
 
 
 def get_level_name(verbose):
     """Return the log levels for the CLI verbosity flag in words."""
-    verbose = min(verbose, 3)
-    level_dict = {
-        0: "ERROR/FATAL/CRITICAL",
-        1: "WARNING",
-        2: "INFO",
-        3: "DEBUG",
-    }
-    return level_dict[verbose]
+    return VERBOSITY_LEVEL_NAMES[min(verbose, 3)]
 
 
 class TqdmLoggingHandler(logging.Handler):
@@ -37,12 +35,15 @@ class TqdmLoggingHandler(logging.Handler):
         # value for level parameter
         # looks like this one: https://github.com/PyCQA/pylint/issues/1085
         super().__init__(level)
+        from libpdf.progress import tqdm  # pylint: disable=import-outside-toplevel
+
+        self.tqdm = tqdm
 
     def emit(self, record):
         """Log the record through tqdm.write."""
         try:
             msg = self.format(record)
-            tqdm.write(msg)
+            self.tqdm.write(msg)
             self.flush()
         except (KeyboardInterrupt, SystemExit):  # pylint: disable=try-except-raise
             # only these 2 exceptions should be raised to the terminal, so an immediate raise is needed to split them
@@ -64,31 +65,28 @@ def config_logger(cli=True):
     For CLI usage the handler is always initialized, if tqdm is available it gets a special TQDM handler, if not
     only basic init is done.
     """
-    init_basic = False
-    init_tqdm = False
-    if cli:
-        if TQDM_AVAILABLE:
-            init_tqdm = True
-        else:
-            init_basic = True
-    elif TQDM_AVAILABLE:
-        # this needs to be documented so any API user is not surprised that the libpdf logger has an attached
-        # handler; users may delete it if unwanted or it could be configurable later if tqdm handler should be
-        # used or the user wants to define something else
-        init_tqdm = True
-    else:  # don't init anything, it's up to the user
-        pass
+    # the optional tqdm dependency is only probed once logging gets configured
+    from libpdf.progress import TQDM_AVAILABLE  # pylint: disable=import-outside-toplevel
 
     log_format = "[%(levelname)5s] %(name)s - %(message)s"
-    if init_tqdm:
-        root_logger = logging.getLogger()
+    if cli:
+        # the CLI owns the process and log_format uses no thread or process information, so the records can skip
+        # collecting it; API users keep their own logging configuration
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+    if TQDM_AVAILABLE:
+        # for API usage this needs to be documented so any API user is not surprised that the libpdf logger has an
+        # attached handler; users may delete it if unwanted or it could be configurable later if tqdm handler should
+        # be used or the user wants to define something else
         handler = TqdmLoggingHandler(
             level=logging.DEBUG
         )  # output all messages, log level handling is done in logger
         handler.formatter = logging.Formatter(log_format)
-        root_logger.addHandler(handler)
-    if init_basic:
+        logging.getLogger().addHandler(handler)
+    elif cli:
         logging.basicConfig(format=log_format)
+    # API usage without tqdm does not init anything, it's up to the user
 
 
 def set_log_level(verbose):
@@ -109,18 +107,29 @@ def set_log_level(verbose):
         log.setLevel("DEBUG")
 
 
-def logging_needed(idx_page: int, count_pages: int):
+def make_logging_needed(count_pages: int):
     """
-    Determine if logging is needed for the current page.
+    Create a function that determines if logging is needed for a page in a loop over count_pages pages.
+
+    A log messages shall be emitted every 20% of pages. The interval and the availability of tqdm are determined
+    once per loop instead of for every page.
 
-    A log messages shall be emitted every 20% of pages.
+    :param count_pages: number of pages in the loop
+    :return: function taking the 0-based page index and returning True if logging is needed for it
     """
+    from libpdf.progress import TQDM_AVAILABLE  # pylint: disable=import-outside-toplevel
+
     if TQDM_AVAILABLE:
-        return False
-    twenty_percent = count_pages / 5.0
-    round_up_next_ten = int(math.ceil(twenty_percent / 10.0)) * 10
-    return (
-        idx_page == 0
-        or (idx_page + 1) % round_up_next_ten == 0
-        or idx_page == count_pages - 1
-    )
+        return lambda idx_page: False
+    # 20% of the pages rounded up to the next multiple of ten, ceil(count_pages / 5 / 10) * 10 in integer arithmetic
+    round_up_next_ten = (count_pages + 49) // 50 * 10
+    idx_last_page = count_pages - 1
+
+    def page_logging_needed(idx_page: int) -> bool:
+        return (
+            idx_page == 0
+            or (idx_page + 1) % round_up_next_ten == 0
+            or idx_page == idx_last_page
+        )
+
+    return page_logging_needed
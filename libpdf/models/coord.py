@@ -56,6 +56,8 @@ class Coord:  # pylint: disable=too-few-public-methods # simplicity is good.
     :vartype y1: float
     """
 
+    __slots__ = ("x0", "y0", "x1", "y1")
+
     def __init__(
         self,
         x0: float = None,
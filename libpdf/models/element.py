@@ -45,7 +45,9 @@ class Element(ModelBase, ABC):
         self.b_root = root
         self.b_chapter = chapter
         self.set_position_backref()
-        self.position.page.content.append(self)
+        if self.position is not None and self.position.page is not None:
+            # elements without a page can be constructed off-tree, e.g. in tests
+            self.position.page.content.append(self)
 
     def set_position_backref(self):
         """Set b_element property on self.position members."""
@@ -69,17 +71,14 @@ class Element(ModelBase, ABC):
 
         :type: str
         """
-        if self.b_chapter:
-            curr_chapter = self.b_chapter
-            uid_prefix = curr_chapter.id_
-            while curr_chapter.b_chapter:
-                uid_prefix = curr_chapter.b_chapter.id_ + "/" + uid_prefix
-                curr_chapter = curr_chapter.b_chapter
-            uid = f"{uid_prefix}/{self.id_}"
-        else:
-            uid = f"{self.id_}"
-
-        return uid
+        # collect the ids from the element up to the top level chapter and join them once
+        ids = [self.id_]
+        curr_chapter = self.b_chapter
+        while curr_chapter:
+            ids.append(curr_chapter.id_)
+            curr_chapter = curr_chapter.b_chapter
+
+        return "/".join(reversed(ids))
 
     def contains_coord(self, page: int, x: float, y: float):
         """
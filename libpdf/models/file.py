@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 
 from libpdf.models.file_meta import FileMeta
 from libpdf.models.model_base import ModelBase
-from libpdf.utils import string_to_identifier
 
 # avoid import cycles for back reference type hinting
 # https://mypy.readthedocs.io/en/latest/common_issues.html#import-cycles
@@ -99,4 +98,9 @@ class File(ModelBase):
         is used. The file identifier is built from the file name including extension. All characters are removed that
         do not follow the Python identifier character set (Regex character set ``[_a-zA-Z0-9]``).
         """
+        # libpdf.utils loads pdfminer and pdfplumber, import it only when needed so the models stay lightweight
+        from libpdf.utils import (  # pylint: disable=import-outside-toplevel
+            string_to_identifier,
+        )
+
         return "file." + string_to_identifier(self.name)
@@ -3,6 +3,49 @@
 from __future__ import annotations
 
 
+def _text_objs_bbox(text_objs: list) -> tuple[float, float, float, float]:
+    """
+    Obtain the rectangle enclosing a list of libpdf text objects in one pass.
+
+    :param text_objs: non-empty list of Char, Word or HorizontalLine objects
+
+    Returns:
+        x0, y0, x1, y1 of the enclosing rectangle
+
+    """
+    first = text_objs[0]
+    x0, y0, x1, y1 = first.x0, first.y0, first.x1, first.y1
+    for text_obj in text_objs:
+        x0 = min(x0, text_obj.x0)
+        y0 = min(y0, text_obj.y0)
+        x1 = max(x1, text_obj.x1)
+        y1 = max(y1, text_obj.y1)
+    return x0, y0, x1, y1
+
+
+def _text_objs_common_style(text_objs: list) -> tuple[tuple | None, str | None]:
+    """
+    Obtain the ncolor and fontname shared by all libpdf text objects in one pass.
+
+    :param text_objs: non-empty list of Char or Word objects
+
+    Returns:
+        ncolor and fontname, each is None if it is not set or differs
+        between the objects
+
+    """
+    ncolor = text_objs[0].ncolor
+    fontname = text_objs[0].fontname
+    for text_obj in text_objs:
+        if ncolor is not None and text_obj.ncolor != ncolor:
+            ncolor = None
+        if fontname is not None and text_obj.fontname != fontname:
+            fontname = None
+        if ncolor is None and fontname is None:
+            break
+    return ncolor, fontname
+
+
 class Char:  # pylint: disable=too-few-public-methods # simplicity is good.
     """
     Define the character class.
@@ -23,6 +66,8 @@ class Char:  # pylint: disable=too-few-public-methods # simplicity is good.
     :vartype ncolor: Tuple[float, float, float]
     """
 
+    __slots__ = ("fontname", "ncolor", "text", "x0", "x1", "y0", "y1")
+
     def __init__(
         self,
         text: str,
@@ -57,6 +102,8 @@ class Word:
     :vartype chars: List[Char]
     """
 
+    __slots__ = ("_text", "chars", "fontname", "ncolor", "x0", "x1", "y0", "y1")
+
     def __init__(
         self,
         chars: list[Char],
@@ -73,26 +120,19 @@ class Word:
         self.chars = chars
         self.ncolor = None
         self.fontname = None
+        self._text = None
 
         if self.chars:
             # Obtain the rectangle coordinates from a list of libpdf text objects
-            self.x0 = min(text_obj.x0 for text_obj in self.chars)
-            self.y0 = min(text_obj.y0 for text_obj in self.chars)
-            self.x1 = max(text_obj.x1 for text_obj in self.chars)
-            self.y1 = max(text_obj.y1 for text_obj in self.chars)
-
-            for n in ["ncolor", "fontname"]:
-                if all(
-                    getattr(x, n) == getattr(self.chars[0], n)
-                    and getattr(x, n) is not None
-                    for x in self.chars
-                ):
-                    setattr(self, n, getattr(self.chars[0], n))
+            self.x0, self.y0, self.x1, self.y1 = _text_objs_bbox(self.chars)
+            self.ncolor, self.fontname = _text_objs_common_style(self.chars)
 
     @property
     def text(self) -> str:
-        """Return plain text."""
-        return "".join([x.text for x in self.chars])
+        """Return plain text, computed on first access."""
+        if self._text is None:
+            self._text = "".join([x.text for x in self.chars])
+        return self._text
 
     def __repr__(self) -> str:
         """Make the text part of the repr for better debugging."""
@@ -109,6 +149,8 @@ class HorizontalLine:
     :vartype words: List[Word]
     """
 
+    __slots__ = ("_text", "fontname", "ncolor", "words", "x0", "x1", "y0", "y1")
+
     def __init__(
         self,
         words: list[Word],
@@ -125,26 +167,19 @@ class HorizontalLine:
         self.words = words
         self.ncolor = None
         self.fontname = None
+        self._text = None
 
         if self.words:
             # Obtain the rectangle coordinates from a list of libpdf text objects
-            self.x0 = min(text_obj.x0 for text_obj in self.words)
-            self.y0 = min(text_obj.y0 for text_obj in self.words)
-            self.x1 = max(text_obj.x1 for text_obj in self.words)
-            self.y1 = max(text_obj.y1 for text_obj in self.words)
-
-            for n in ["ncolor", "fontname"]:
-                if all(
-                    getattr(x, n) == getattr(self.words[0], n)
-                    and getattr(x, n) is not None
-                    for x in self.words
-                ):
-                    setattr(self, n, getattr(self.words[0], n))
+            self.x0, self.y0, self.x1, self.y1 = _text_objs_bbox(self.words)
+            self.ncolor, self.fontname = _text_objs_common_style(self.words)
 
     @property
     def text(self) -> str:
-        """Return plain text."""
-        return " ".join([x.text for x in self.words])
+        """Return plain text, computed on first access."""
+        if self._text is None:
+            self._text = " ".join([x.text for x in self.words])
+        return self._text
 
     def __repr__(self) -> str:
         """Make the text part of the repr for better debugging."""
@@ -161,6 +196,18 @@ class HorizontalBox:
     :vartype lines: List[HorizontalLine]
     """
 
+    __slots__ = (
+        "_text",
+        "_words",
+        "fontname",
+        "lines",
+        "ncolor",
+        "x0",
+        "x1",
+        "y0",
+        "y1",
+    )
+
     def __init__(
         self,
         lines: list[HorizontalLine],
@@ -177,32 +224,29 @@ class HorizontalBox:
         self.lines = lines
         self.ncolor = None
         self.fontname = None
+        self._text = None
+        # the words are flattened once, they are needed for the style check below
+        # and by the words property
+        self._words = (
+            [word for line in self.lines for word in line.words] if self.lines else []
+        )
 
         if self.lines:
             # Obtain the rectangle coordinates from a list of libpdf text objects.
-            self.x0 = min(text_obj.x0 for text_obj in self.lines)
-            self.y0 = min(text_obj.y0 for text_obj in self.lines)
-            self.x1 = max(text_obj.x1 for text_obj in self.lines)
-            self.y1 = max(text_obj.y1 for text_obj in self.lines)
-
-            _words = [word for line in self.lines for word in line.words]
-
-            for n in ["ncolor", "fontname"]:
-                if all(
-                    getattr(x, n) == getattr(_words[0], n) and getattr(x, n) is not None
-                    for x in _words
-                ):
-                    setattr(self, n, getattr(_words[0], n))
+            self.x0, self.y0, self.x1, self.y1 = _text_objs_bbox(self.lines)
+            self.ncolor, self.fontname = _text_objs_common_style(self._words)
 
     @property
     def text(self) -> str:
-        """Return plain text."""
-        return "\n".join([x.text for x in self.lines])
+        """Return plain text, computed on first access."""
+        if self._text is None:
+            self._text = "\n".join([x.text for x in self.lines])
+        return self._text
 
     @property
-    def words(self) -> list[str]:
-        """Return list of words."""
-        return [word for line in self.lines for word in line.words]
+    def words(self) -> list[Word]:
+        """Return list of words, the cached list of the box, treat it as read-only."""
+        return self._words
 
     def __repr__(self) -> str | None:
         """Make the text part of the repr for better debugging."""
@@ -212,6 +212,8 @@ RENDER_ELEMENTS = [
     "figure",
     "rect",
 ]  # the elements that shall be rendered
+# for membership checks of user given elements
+RENDER_ELEMENTS_SET = frozenset(RENDER_ELEMENTS)
 
 # pdfminer layout analysis parameter from from pdfminer.layout -> LAParams.__init__
 # These are needed for 2 reasons:
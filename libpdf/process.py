@@ -8,16 +8,14 @@ It includes:
 4. yaml output
 """
 
+import bisect
 import datetime
 import decimal
 import json
 import logging
 import os
 import sys
-from typing import Dict, List, Optional, Union
-
-import ruamel.yaml
-from ruamel.yaml.representer import RoundTripRepresenter
+from typing import Dict, List, Optional, Tuple, Union
 
 from libpdf import parameters
 from libpdf.apiobjects import ApiObjects
@@ -32,10 +30,20 @@ from libpdf.models.paragraph import Paragraph
 from libpdf.models.position import Position
 from libpdf.models.rect import Rect
 from libpdf.models.table import Cell, Table
-from libpdf.parameters import HEADLINE_TOLERANCE
+from libpdf.parameters import HEADLINE_TOLERANCE, TARGET_COOR_TOLERANCE
 
 LOG = logging.getLogger(__name__)
 
+ORJSON_AVAILABLE = False
+
+# handle optional dependency orjson for faster JSON output
+try:
+    import orjson  # pylint: disable=import-error
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
 
 def remove_page_header_footer(single_page):
     """Remove header and footer."""
@@ -52,16 +60,33 @@ def remove_page_header_footer(single_page):
     return page_crop
 
 
-class MyRepresenter(RoundTripRepresenter):  # pylint: disable=too-few-public-methods
-    """Customized representer of yaml."""
+def yaml_dumper():
+    """
+    Create the ruamel.yaml instance for the yaml output.
 
-    def represent_mapping(self, tag, mapping, flow_style=None):
-        """Override represent_mapping."""
-        tag = "tag:yaml.org,2002:map"
+    ruamel.yaml is only imported here because the yaml output is only written for CLI usage, so library users
+    calling libpdf.load() do not pay for the import.
+    """
+    import ruamel.yaml  # pylint: disable=import-outside-toplevel
+    from ruamel.yaml.representer import (  # pylint: disable=import-outside-toplevel
+        RoundTripRepresenter,
+    )
 
-        return RoundTripRepresenter.represent_mapping(
-            self, tag, mapping, flow_style=flow_style
-        )
+    class MyRepresenter(RoundTripRepresenter):  # pylint: disable=too-few-public-methods
+        """Customized representer of yaml."""
+
+        def represent_mapping(self, tag, mapping, flow_style=None):
+            """Override represent_mapping."""
+            tag = "tag:yaml.org,2002:map"
+
+            return RoundTripRepresenter.represent_mapping(
+                self, tag, mapping, flow_style=flow_style
+            )
+
+    ruamel_yaml = ruamel.yaml.YAML()
+    ruamel_yaml.Representer = MyRepresenter
+    ruamel_yaml.indent(sequence=4, offset=2)
+    return ruamel_yaml
 
 
 def to_dict_output(obj: Union[ModelBase, Position]) -> Dict:  # pylint: disable=too-many-branches  #easy to in one func
@@ -128,6 +153,31 @@ def json_datetime_converter(obj):
     return obj
 
 
+def json_dumps(output_dict: Dict) -> Union[bytes, str]:
+    """
+    Serialize the output dictionary to indented JSON.
+
+    The optional dependency orjson is used if it is installed, it returns UTF-8 encoded bytes. Otherwise the json
+    module of the standard library returns a str with non-ASCII characters escaped as ``\\uXXXX``.
+    Datetimes are serialized by json_datetime_converter() in both cases.
+
+    :param output_dict: dictionary of the extracted content
+    :return: JSON as bytes (orjson) or str (json)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            output_dict,
+            default=json_datetime_converter,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(
+        output_dict,
+        default=json_datetime_converter,
+        indent=2,
+        sort_keys=False,
+    )
+
+
 def output_dump(output_format: str, output_path: str, objects: ApiObjects):
     """
     Dump the extracted content into a yaml file.
@@ -138,9 +188,7 @@ def output_dump(output_format: str, output_path: str, objects: ApiObjects):
     :return:
     """
     # TODO docstring incomplete
-    ruamel_yaml = ruamel.yaml.YAML()
-    ruamel_yaml.Representer = MyRepresenter
-    ruamel_yaml.indent(sequence=4, offset=2)
+    ruamel_yaml = yaml_dumper() if output_format == "yaml" else None
     # # ruamel_yaml.representer.ignore_aliases = lambda *data: True
     #
     # ruamel_yaml.register_class(Table)
@@ -158,14 +206,14 @@ def output_dump(output_format: str, output_path: str, objects: ApiObjects):
     if output_path is None:
         LOG.info("Writing extracted data to stdout")
         if output_format == "json":
-            print(
-                json.dumps(
-                    output_dict,
-                    default=json_datetime_converter,
-                    indent=2,
-                    sort_keys=False,
-                )
-            )
+            json_output = json_dumps(output_dict)
+            if isinstance(json_output, bytes):
+                # the UTF-8 bytes of orjson go to the binary buffer, so they do not depend on the console encoding
+                sys.stdout.flush()
+                sys.stdout.buffer.write(json_output + b"\n")
+                sys.stdout.buffer.flush()
+            else:
+                print(json_output)
         elif output_format == "yaml":
             ruamel_yaml.dump(output_dict, sys.stdout)
     else:
@@ -173,16 +221,16 @@ def output_dump(output_format: str, output_path: str, objects: ApiObjects):
         if output_dir:
             if not os.path.isdir(output_dir):
                 os.makedirs(output_dir)
-        with open(output_path, "w", encoding="utf-8") as file:
-            if output_format == "json":
-                json_string = json.dumps(
-                    output_dict,
-                    default=json_datetime_converter,
-                    indent=2,
-                    sort_keys=False,
-                )
-                file.write(json_string)
-            elif output_format == "yaml":
+        if output_format == "json":
+            json_output = json_dumps(output_dict)
+            if isinstance(json_output, bytes):
+                with open(output_path, "wb") as file:
+                    file.write(json_output)
+            else:
+                with open(output_path, "w", encoding="utf-8") as file:
+                    file.write(json_output)
+        elif output_format == "yaml":
+            with open(output_path, "w", encoding="utf-8") as file:
                 ruamel_yaml.dump(output_dict, file)
 
 
@@ -419,6 +467,8 @@ def libpdf_target_explorer(  # pylint: disable=too-many-nested-blocks # local al
     :param elements: a list of paragraphs or tables, where the results of conversion are directly applied.
     :param pages_list: a list of pages referred by the elements
     """
+    # target pages and their element indexes are built once and shared by all links pointing to them
+    target_indexes = {}
     # find the page containing source links
     for page in pages_list:
         if page.number in catalog["annos"]:
@@ -433,7 +483,9 @@ def libpdf_target_explorer(  # pylint: disable=too-many-nested-blocks # local al
                 for element in elements_with_anno:
                     if len(element.links) > 0:
                         for link in element.links:
-                            target_id = find_target_id(link, pages_list, element)
+                            target_id = find_target_id(
+                                link, pages_list, element, target_indexes
+                            )
                             link.libpdf_target = target_id
                     elif isinstance(element, Cell):
                         # Cell is not considered as element
@@ -486,7 +538,12 @@ def elements_with_anno_finder(
     return elements_with_anno
 
 
-def find_target_id(link: Link, pages_list: List[Page], src_element: Element) -> str:
+def find_target_id(
+    link: Link,
+    pages_list: List[Page],
+    src_element: Element,
+    target_indexes: Optional[Dict[int, tuple]] = None,
+) -> str:
     """
     Find the corresponding libpdf target element ID from positions.
 
@@ -495,23 +552,31 @@ def find_target_id(link: Link, pages_list: List[Page], src_element: Element) ->
                         example for explicit target: ``page: 4 rect_X: 300 rect_Y: 400``
     :param pages_list: list of libpdf pages
     :param src_element: the element that contains the source link, for logging purposes
+    :param target_indexes: cache mapping target page numbers to the page and its element index, filled on demand
     :return: libpdf target ID if the target element is found, otherwise a string representing the
              page with the x/y coordinate of the destination
     """
     target_id = None
 
     if link.pos_target["page"]:
-        for page in pages_list:
-            if page.number == link.pos_target["page"]:
-                target_page = page
-        # target_page = pages_list[link.pos_target['page'] - 1]
-        elements_target_page = get_elements_page(target_page)
-        for element in elements_target_page:
-            if element.contains_coord(
-                link.pos_target["page"], link.pos_target["x"], link.pos_target["y"]
-            ):
-                target_id = nest_explorer(element)
-                break
+        target_page_number = link.pos_target["page"]
+        if target_indexes is None:
+            target_indexes = {}
+        if target_page_number not in target_indexes:
+            for page in pages_list:
+                if page.number == target_page_number:
+                    target_page = page
+            # target_page = pages_list[link.pos_target['page'] - 1]
+            target_indexes[target_page_number] = (
+                target_page,
+                index_elements_page(target_page),
+            )
+        target_page, target_index = target_indexes[target_page_number]
+        element = find_element_containing(
+            target_index, target_page_number, link.pos_target["x"], link.pos_target["y"]
+        )
+        if element is not None:
+            target_id = nest_explorer(element)
 
         if not target_id:
             # If no libpdf element is found,
@@ -521,15 +586,17 @@ def find_target_id(link: Link, pages_list: List[Page], src_element: Element) ->
                 f'{target_page.id_}/{link.pos_target["x"]}:{link.pos_target["y"]}'
             )
 
-            text = str(src_element)
-            text_shortened = (text[:60] + "..") if len(text) > 60 else text
-            LOG.debug(
-                'The link "%s" on page %s could not be resolved to a libpdf element; replacing it with the raw '
-                "target page coordinate %s",
-                text_shortened,
-                src_element.position.page.number,
-                target_id,
-            )
+            if LOG.isEnabledFor(logging.DEBUG):
+                # the element text is only rendered if the message is emitted
+                text = str(src_element)
+                text_shortened = (text[:60] + "..") if len(text) > 60 else text
+                LOG.debug(
+                    'The link "%s" on page %s could not be resolved to a libpdf element; replacing it with the raw '
+                    "target page coordinate %s",
+                    text_shortened,
+                    src_element.position.page.number,
+                    target_id,
+                )
     else:
         target_id = "Out Of extracted pages scope"
 
@@ -552,6 +619,55 @@ def get_elements_page(target_page: Page) -> List[Union[Paragraph, Table, Figure,
     return elements_target_page
 
 
+def index_elements_page(
+    target_page: Page,
+) -> Tuple[List[float], List[Tuple[int, Element]]]:
+    """
+    Index the elements on a target page by the left-most x coordinate a link target may have to hit them.
+
+    Element.contains_coord accepts link targets with x >= x0 - TARGET_COOR_TOLERANCE, so sorting by this
+    value lets find_element_containing() bisect away all elements starting to the right of a target.
+
+    :param target_page: a page which is directed to by target links
+    :return: ascending list of x0 - TARGET_COOR_TOLERANCE and the matching (page order index, element) tuples
+    """
+    indexed_elements = sorted(
+        enumerate(get_elements_page(target_page)),
+        key=lambda idx_element: idx_element[1].position.x0 - TARGET_COOR_TOLERANCE,
+    )
+    x_min_list = [
+        element.position.x0 - TARGET_COOR_TOLERANCE for _, element in indexed_elements
+    ]
+    return x_min_list, indexed_elements
+
+
+def find_element_containing(
+    target_index: Tuple[List[float], List[Tuple[int, Element]]],
+    page: int,
+    x: float,
+    y: float,
+) -> Optional[Element]:
+    """
+    Find the first element in page order that contains the coordinate x,y.
+
+    :param target_index: element index of the page as returned by index_elements_page()
+    :param page: page number
+    :param x: x coordinate of a link target
+    :param y: y coordinate of a link target
+    :return: the containing element that comes first on the page or None if no element contains x,y
+    """
+    x_min_list, indexed_elements = target_index
+    found_idx = None
+    found_element = None
+    for idx, element in indexed_elements[: bisect.bisect_right(x_min_list, x)]:
+        if (found_idx is None or idx < found_idx) and element.contains_coord(
+            page, x, y
+        ):
+            found_idx = idx
+            found_element = element
+    return found_element
+
+
 def nest_explorer(element: Union[Figure, Rect, Table, Chapter, Paragraph]) -> str:
     """
     Explore the nested target ID path recursively.
@@ -25,7 +25,7 @@ from pdfminer.layout import LTPage, LTTextBoxHorizontal
 
 from libpdf import textbox, utils
 from libpdf.catalog import catalog
-from libpdf.log import logging_needed
+from libpdf.log import make_logging_needed
 from libpdf.models.figure import Figure
 from libpdf.models.page import Page
 from libpdf.models.position import Position
@@ -37,15 +37,6 @@ from libpdf.utils import from_pdfplumber_bbox, lt_to_libpdf_hbox_converter
 LOG = logging.getLogger(__name__)
 
 
-class FoldedStr(str):
-    """Pass the folded string for scalar node."""
-
-
-def folded_str_representer(dumper, text):
-    """Warp function of the representer."""
-    return dumper.represent_scalar("tag", text, style=">")
-
-
 def extract_pdf_table(pdf, pages_list: List[Page], figure_list: List[Figure]):
     """
     Extract the table in PDF.
@@ -78,9 +69,9 @@ def extract_pdf_table(pdf, pages_list: List[Page], figure_list: List[Figure]):
         "intersection_y_tolerance": None,
     }
 
-    table_dict = {"page": {}}
     table_list = []
     table_id = 1
+    page_logging_needed = make_logging_needed(len(pdf.pages))
     for idx_page, page in enumerate(
         tqdm(
             pdf.pages,
@@ -89,10 +80,9 @@ def extract_pdf_table(pdf, pages_list: List[Page], figure_list: List[Figure]):
             bar_format=bar_format_lvl2(),
         ),
     ):
-        if logging_needed(idx_page, len(pdf.pages)):
+        if page_logging_needed(idx_page):
             LOG.debug("Extracting tables page %s of %s", idx_page + 1, len(pdf.pages))
         if len(page.find_tables(table_settings)) != 0:
-            table_dict["page"].update({idx_page + 1: []})
             tables = page.find_tables(table_settings)
             lt_page = page._layout  # pylint: disable=protected-access  # easiest way to obtain LTPage
             for table in tables:
@@ -115,43 +105,22 @@ def extract_pdf_table(pdf, pages_list: List[Page], figure_list: List[Figure]):
                 )
 
                 if _table_figure_check(table_pos, figure_list) is True:
-                    table_dict["page"][idx_page + 1].append(
-                        {
-                            "id": "table." + str(table_id),
-                            "type": "table",
-                            "positions": table_pos,
-                            # 'text': table_temp.extract(2, 2),
-                            "cell": [],
-                        },
-                    )
-
-                    cells = extract_cells(
-                        lt_page,
-                        table.rows,
-                        table_dict["page"][idx_page + 1][
-                            len(table_dict["page"][idx_page + 1]) - 1
-                        ]["cell"],
-                        pages_list[idx_page],
-                    )
+                    cells = extract_cells(lt_page, table.rows, pages_list[idx_page])
 
                     table = Table(idx=table_id, cells=cells, position=table_pos)
                     table_list.append(table)
 
                     table_id += 1
 
-            if len(table_dict["page"][idx_page + 1]) == 0:  # no table is added
-                del table_dict["page"][idx_page + 1]
-
     return table_list
 
 
-def extract_cells(lt_page: LTPage, rows: List, list_cell: List[Cell], page: Page):
+def extract_cells(lt_page: LTPage, rows: List, page: Page):
     """
     Extract cells in the table.
 
     :param lt_page: LTPage instance
     :param rows: a list of rows in the current table
-    :param list_cell: a empty list of cells for each table will be updated
     :param pages_list: a list of pages
     :return: list of Cell objects
     """
@@ -176,9 +145,7 @@ def extract_cells(lt_page: LTPage, rows: List, list_cell: List[Cell], page: Page
                 # extract cell text
                 lt_textbox = cell_lttextbox_extraction(pos_cell, lt_page)
                 links = []
-                text_cell = ""
                 if lt_textbox:
-                    text_cell = lt_textbox.get_text()
                     if catalog["annos"]:
                         links = textbox.extract_linked_chars(lt_textbox, lt_page.pageid)
 
@@ -186,16 +153,6 @@ def extract_cells(lt_page: LTPage, rows: List, list_cell: List[Cell], page: Page
                 else:
                     hbox = None
 
-                cell = {
-                    "row": idx_row + 1,
-                    "col": idx_cell + 1,
-                    "positions": pos_cell_bbox,
-                    "text": FoldedStr(text_cell),
-                    "links": links,
-                }
-
-                list_cell.append(cell)
-
                 cell_obj = Cell(
                     idx_row + 1, idx_cell + 1, pos_cell, links, textbox=hbox
                 )
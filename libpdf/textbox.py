@@ -44,7 +44,7 @@ from pdfminer.layout import (
 
 from libpdf import parameters
 from libpdf.catalog import catalog
-from libpdf.log import logging_needed
+from libpdf.log import make_logging_needed
 from libpdf.models.chapter import Chapter
 from libpdf.models.figure import Figure
 from libpdf.models.link import Link
@@ -945,6 +945,13 @@ def pdfminer_get_lt_textboxes(pdf) -> Dict[int, List[LTTextBox]]:
     LOG.info("Extracting layout ...")
     page_lt_textboxes = {}
 
+    # boundaries of the page crop margin parameters, read once instead of for every lt_textbox
+    crop_top = float(pdf.pages[0].height) - parameters.PAGE_CROP_MARGINS["top"]
+    crop_bottom = parameters.PAGE_CROP_MARGINS["bottom"]
+    crop_left = parameters.PAGE_CROP_MARGINS["left"]
+    crop_right = float(pdf.pages[0].width) - parameters.PAGE_CROP_MARGINS["right"]
+
+    page_logging_needed = make_logging_needed(len(pdf.pages))
     for idx_page, page in enumerate(
         tqdm(
             pdf.pages,
@@ -954,24 +961,21 @@ def pdfminer_get_lt_textboxes(pdf) -> Dict[int, List[LTTextBox]]:
             bar_format=bar_format_lvl2(),
         ),
     ):
-        if logging_needed(idx_page, len(pdf.pages)):
+        if page_logging_needed(idx_page):
             LOG.debug("Extracting layout page %s of %s", idx_page + 1, len(pdf.pages))
 
         pdf.interpreter.process_page(page.page_obj)
         result = pdf.device.get_result()
-        lt_textboxes = [obj for obj in result if isinstance(obj, LTTextBox)]
         # remove detected header and footer lt_textboxes based on given page crop margin parameter
-        filter_lt_textboxes = list(
-            filter(
-                lambda lt_textbox: lt_textbox.y1
-                < (float(pdf.pages[0].height) - parameters.PAGE_CROP_MARGINS["top"])
-                and lt_textbox.y0 > parameters.PAGE_CROP_MARGINS["bottom"]
-                and lt_textbox.x0 > parameters.PAGE_CROP_MARGINS["left"]
-                and lt_textbox.x1
-                < (float(pdf.pages[0].width) - parameters.PAGE_CROP_MARGINS["right"]),
-                lt_textboxes,
-            ),
-        )
+        filter_lt_textboxes = [
+            obj
+            for obj in result
+            if isinstance(obj, LTTextBox)
+            and obj.y1 < crop_top
+            and obj.y0 > crop_bottom
+            and obj.x0 > crop_left
+            and obj.x1 < crop_right
+        ]
         page_lt_textboxes[page.page_number - 1] = filter_lt_textboxes
 
     return page_lt_textboxes
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import bisect
+import codecs
 import copy
 import logging
+import operator
 import os
 import re
 from decimal import Decimal
@@ -36,7 +39,7 @@ from pdfminer.pdfpage import PDFPage
 from pdfminer.pdfparser import PDFParser
 
 from libpdf.exceptions import TextContainsNewlineError
-from libpdf.log import logging_needed
+from libpdf.log import make_logging_needed
 from libpdf.models.chapter import Chapter
 from libpdf.models.figure import Figure
 from libpdf.models.horizontal_box import Char, HorizontalBox, HorizontalLine, Word
@@ -70,7 +73,23 @@ LOG = logging.getLogger(__name__)
 
 
 def decode_title(obj_bytes: bytes) -> str:
-    """Decode catalog headline using chardet library."""
+    """
+    Decode catalog headline.
+
+    Titles that are UTF-16BE with a byte order mark or plain ASCII are decoded
+    directly, all other titles are decoded using the encoding detected by the chardet
+    library.
+
+    :param obj_bytes: raw title bytes of an outline entry
+    :return: decoded title
+    """
+    if obj_bytes.isascii():
+        return obj_bytes.decode("ascii")
+    if obj_bytes.startswith(codecs.BOM_UTF16_BE):
+        try:
+            return obj_bytes[len(codecs.BOM_UTF16_BE) :].decode("utf-16-be")
+        except UnicodeDecodeError:
+            pass  # let chardet have a go below
     chardet_ret = chardet.detect(obj_bytes)
     try:
         str_ret = obj_bytes.decode(chardet_ret["encoding"])
@@ -431,6 +450,67 @@ def lt_page_crop(
     return lt_objs_in_bbox
 
 
+def index_lt_objs_by_x0(
+    lt_objs: list,
+    lt_type_in_filter: type[LTText | LTCurve | LTImage | LTFigure],
+) -> tuple[list[float], list[tuple[int, LTComponent]]]:
+    """
+    Sort the pdfminer layout objects of the given type by their x0 coordinate.
+
+    The index is built once per page and queried by lt_page_crop_indexed() for each
+    bounding box, so only the objects within the x range of a bounding box are checked.
+
+    :param lt_objs: A list of pdfminer layout elements on a page
+    :param lt_type_in_filter: a type filter of LTItem from pdfminer
+
+    Returns:
+        the sorted x0 coordinates and the (position in lt_objs, layout object) pairs
+        in the same order
+
+    """
+    indexed_objs = sorted(
+        (
+            (idx, element)
+            for idx, element in enumerate(lt_objs)
+            if isinstance(element, lt_type_in_filter)
+        ),
+        key=lambda indexed_obj: indexed_obj[1].x0,
+    )
+    return [element.x0 for _, element in indexed_objs], indexed_objs
+
+
+def lt_page_crop_indexed(
+    bbox: tuple[float, float, float, float],
+    lt_objs_index: tuple[list[float], list[tuple[int, LTComponent]]],
+) -> list:
+    """
+    Find the layout objects completely inside the bounding box using an x0 index.
+
+    The result equals lt_page_crop() with contain_completely=True, including the
+    order of the objects.
+
+    :param bbox: bounding box, rectangular area [x0, y0, x1, y1]
+    :param lt_objs_index: layout objects sorted by x0 as returned by
+        index_lt_objs_by_x0()
+
+    Returns:
+        a list of LT objects completely inside the bounding box
+
+    """
+    x0_list, indexed_objs = lt_objs_index
+    # objects completely inside the bbox start right of its left and left of its
+    # right boundary
+    start = bisect.bisect_right(x0_list, bbox[0])
+    end = bisect.bisect_left(x0_list, bbox[2], lo=start)
+    candidates = [
+        indexed_obj
+        for indexed_obj in indexed_objs[start:end]
+        if check_lt_obj_in_bbox(indexed_obj[1], bbox)
+    ]
+    candidates.sort(key=operator.itemgetter(0))
+    return [element for _, element in candidates]
+
+
 def lt_to_libpdf_hbox_converter(
     lt_objs: list[LTTextBoxHorizontal],
 ) -> HorizontalBox | None:
@@ -784,6 +864,7 @@ def render_pages(
     render_elements_joined = ", ".join(render_elements)
     LOG.info("Saving annotated images for %s ...", render_elements_joined)
 
+    page_logging_needed = make_logging_needed(len(pdf_pages))
     for page in tqdm(
         pdf_pages,
         desc=f"### Saving {render_elements_joined}",
@@ -793,7 +874,7 @@ def render_pages(
     ):
         page_no = page.page_number
 
-        if logging_needed(page_no - 1, len(pdf_pages)):
+        if page_logging_needed(page_no - 1):
             LOG.info(
                 "Saving annotated images for %s page %s of %s",
                 render_elements_joined,
@@ -893,8 +974,9 @@ def extract_layout(path_pdf: str, idx_single_page: int | None = None) -> dict[in
     page_containers = {}  # return dictionary
 
     page_count = doc.catalog["Pages"].resolve()["Count"]
+    page_logging_needed = make_logging_needed(page_count)
     for idx_page, page in enumerate(pages):
-        if logging_needed(idx_page, page_count):
+        if page_logging_needed(idx_page):
             LOG.debug("Extracting layout page %s of %s", idx_page + 1, page_count)
         if idx_single_page is not None and idx_single_page != idx_page:
             continue
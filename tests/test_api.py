@@ -1,10 +1,12 @@
 """Initial test cases for API."""
 
+import json
 import logging
 
 import pytest
 
 from libpdf import load
+from libpdf.process import json_dumps, to_dict_output
 from tests.conftest import PDF_LOREM_IPSUM, PDF_TWO_COLUMNS
 
 
@@ -33,3 +35,16 @@ def test_logging(tmpdir, monkeypatch):
     logging.basicConfig()
     objects = load(PDF_LOREM_IPSUM, figure_dir=str(tmpdir))
     assert objects is None
+
+
+def test_json_dumps_orjson_parity(tmpdir, monkeypatch):
+    """Check if the JSON output holds the same data with and without the optional orjson."""
+    pytest.importorskip("orjson")
+    # the CLI passes the PDF path as str
+    objects = load(str(PDF_LOREM_IPSUM), figure_dir=str(tmpdir))
+    output_dict = {"root": to_dict_output(objects.root), "text": "Größe – naïve ✓"}
+    orjson_output = json_dumps(output_dict)
+    monkeypatch.setattr("libpdf.process.ORJSON_AVAILABLE", False)
+    json_output = json_dumps(output_dict)
+    assert json_output.isascii()
+    assert json.loads(json_output) == json.loads(orjson_output)
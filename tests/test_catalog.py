@@ -1,8 +1,11 @@
 """Test catalog extraction."""
 
 from click.testing import CliRunner
+from pdfminer.pdftypes import PDFObjRef
 
 import libpdf
+from libpdf.catalog import _resolve_pdf_obj_refs, resolve_name_obj
+from libpdf.utils import decode_title
 from tests.conftest import (
     PDF_OUTLINE_NO_DEST,
     PDF_PYTHON_LOGGING,
@@ -38,3 +41,55 @@ def test_catalog_outline_title():
     assert objects is not None
     # check outline title is correctly resolved
     assert objects.flattened.chapters[0].title == "Basic Logging Tutorial"
+
+
+class _Ref:  # pylint: disable=too-few-public-methods
+    """Minimal stand-in for pdfminer's PDFObjRef."""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def resolve(self):
+        """Return the referenced object."""
+        return self.obj
+
+
+def test_resolve_name_obj_mixed_depth():
+    """Check if name tree leaves on different levels are all collected."""
+    leaf_top = {"Names": [b"a", "dest_a"]}
+    leaf_deep = {"Names": [b"b", "dest_b"]}
+    kids = [leaf_top, {"Kids": [_Ref({"Kids": [_Ref(leaf_deep)]})]}]
+    assert resolve_name_obj(kids) == [leaf_top, leaf_deep]
+    assert resolve_name_obj([]) == []
+
+
+class _Doc:  # pylint: disable=too-few-public-methods
+    """Minimal stand-in for pdfminer's PDFDocument object lookup."""
+
+    def __init__(self, objs):
+        self.objs = objs
+
+    def getobj(self, objid):
+        """Return the object stored under objid."""
+        return self.objs[objid]
+
+
+def test_resolve_pdf_obj_refs_cycle():
+    """Check if reference cycles outside the skipped catalog keys are resolved without endless nesting."""
+    doc = _Doc({})
+    doc.objs[1] = {"Type": "Node", "Kids": [PDFObjRef(doc, 2, None)]}
+    doc.objs[2] = {"Type": "Leaf", "Up": PDFObjRef(doc, 1, None)}
+    resolved_flat = {}
+    resolved, _ = _resolve_pdf_obj_refs(
+        {"Root": PDFObjRef(doc, 1, None)}, resolved_flat
+    )
+    assert set(resolved_flat) == {1, 2}
+    node = resolved["Root"]
+    assert node["Kids"][0]["Type"] == "Leaf"
+    assert node["Kids"][0]["Up"] is node
+
+
+def test_decode_title_fast_paths():
+    """Check that ASCII and UTF-16BE titles with byte order mark decode without the BOM."""
+    assert decode_title(b"1.2 Scope") == "1.2 Scope"
+    assert decode_title(b"\xfe\xff" + "Übersicht".encode("utf-16-be")) == "Übersicht"
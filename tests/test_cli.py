@@ -3,7 +3,7 @@
 import pytest
 from click.testing import CliRunner
 
-from libpdf.core import main_cli
+from libpdf.core import calculate_pages, main_cli
 from tests.conftest import PDF_LOREM_IPSUM, PDF_TWO_COLUMNS
 
 
@@ -19,3 +19,12 @@ def test_cli_ok(path):
     )
     assert result.exception is None
     assert result.exit_code == 0
+
+
+@pytest.mark.parametrize(
+    ("page_range", "pages"),
+    [("4", [4]), ("3-5,7", [3, 4, 5, 7]), ("1,1-3,2", [1, 2, 3])],
+)
+def test_calculate_pages(page_range, pages):
+    """Check if page ranges are expanded to a sorted list of unique pages."""
+    assert calculate_pages(page_range) == pages
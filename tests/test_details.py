@@ -11,6 +11,7 @@ from libpdf.models.paragraph import Paragraph
 from libpdf.models.position import Position
 from libpdf.models.root import Root
 from libpdf.models.table import Cell, Table
+from libpdf.process import find_element_containing, index_elements_page
 from tests.conftest import PDF_LOREM_IPSUM
 
 
@@ -86,3 +87,15 @@ def test_lorem_ipsum():
     del objects  # make pylint happy until implementation is finished
 
     # compare properties
+
+
+def test_find_element_containing():
+    """Check if the first element in page order containing a link target is found."""
+    page = Page(1, 700, 900)
+    outer = Paragraph(1, Position(100, 100, 400, 400, page), [])
+    inner = Paragraph(2, Position(50, 200, 300, 300, page), [])
+    target_index = index_elements_page(page)
+    assert find_element_containing(target_index, 1, 150, 250) is outer
+    assert find_element_containing(target_index, 1, 0, 250) is inner
+    assert find_element_containing(target_index, 1, 500, 250) is None
+    assert find_element_containing(target_index, 2, 150, 250) is None
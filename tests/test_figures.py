@@ -1,8 +1,10 @@
 """Test figures extraction."""
 
 from click.testing import CliRunner
+from pdfminer.layout import LTCurve, LTText, LTTextBoxHorizontal
 
 import libpdf
+from libpdf.utils import index_lt_objs_by_x0, lt_page_crop, lt_page_crop_indexed
 from tests.conftest import (
     PDF_FIGURE_WITH_INVALID_BBOX,
     PDF_FIGURES_EXTRACTION,
@@ -108,3 +110,24 @@ def test_remove_figures_in_header_footer():
     assert objects.flattened.figures[0].position.page.number == 1
     assert objects.flattened.figures[0].position.y0 == 239.15
     assert objects.flattened.figures[0].position.y1 == 382.85
+
+
+def test_lt_page_crop_indexed():
+    """Check the x0 index finds the same objects in the same order as lt_page_crop."""
+    lt_objs = []
+    for idx, bbox in enumerate([
+        (50, 50, 60, 60),
+        (10, 10, 20, 20),
+        (10, 30, 15, 35),
+        (0, 40, 30, 45),
+        (12, 12, 18, 18),
+        (30, 30, 40, 40),
+    ]):
+        lt_obj = LTTextBoxHorizontal() if idx != 4 else LTCurve(1, [])
+        lt_obj.set_bbox(bbox)
+        lt_objs.append(lt_obj)
+    index = index_lt_objs_by_x0(lt_objs, LTText)
+    for bbox in [(5, 5, 45, 50), (10, 10, 20, 20), (9, 9, 61, 61), (100, 0, 200, 10)]:
+        assert lt_page_crop_indexed(bbox, index) == lt_page_crop(
+            bbox, lt_objs, LTText, contain_completely=True
+        )
@@ -1,8 +1,56 @@
 """Import tests."""
 
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PYPROJECT_TOML = Path(__file__).parent.parent / "pyproject.toml"
+
 
 def test_import():
     """Check if the app modules can be imported."""
     from libpdf import core  # pylint: disable=import-outside-toplevel
 
     del core
+
+
+def test_version_matches_pyproject():
+    """Check if the hardcoded version and summary match the ones in pyproject.toml."""
+    import libpdf  # pylint: disable=import-outside-toplevel
+
+    if sys.version_info >= (3, 11):
+        import tomllib  # pylint: disable=import-outside-toplevel
+    else:
+        tomllib = pytest.importorskip("tomli")
+
+    with PYPROJECT_TOML.open("rb") as pyproject_file:
+        poetry_config = tomllib.load(pyproject_file)["tool"]["poetry"]
+
+    assert libpdf.__version__ == poetry_config["version"]
+    assert libpdf.__summary__ == poetry_config["description"]
+
+
+def test_lazy_load():
+    """Check if 'import libpdf' defers loading libpdf.core until load is accessed."""
+    code = (
+        "import sys, libpdf; "
+        "assert 'libpdf.core' not in sys.modules; "
+        "assert 'pdfplumber' not in sys.modules; "
+        "from libpdf import load; "
+        "assert load is libpdf.core.main_api"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lightweight_models():
+    """Check if the models and the log module can be imported without pdfplumber and tqdm."""
+    code = (
+        "import sys, libpdf.models.root, libpdf.log; "
+        "assert 'pdfplumber' not in sys.modules; "
+        "assert 'tqdm' not in sys.modules; "
+        "from libpdf.models.file import File; "
+        "assert File('a b.pdf', 'a b.pdf', 1).id_ == 'file.a_b_pdf'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)